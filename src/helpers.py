@@ -1,27 +1,57 @@
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import statsmodels.formula.api as smf
-import numpy as np
-import random 
 import logging
 import re
 import os
-import numpy as np
-import pandas as pd
-from scipy.stats import bootstrap
-import chardet
+import functools
+import importlib
+import io
+import concurrent.futures
+
+# cchardet is a C++ drop-in for chardet and is ~1000x faster on the byte
+# samples we feed it, so prefer it when installed
+try:
+    import cchardet as chardet
+except ImportError:
+    import chardet
+
+# numba JIT-compiles the bootstrap inner loop; optional, we fall back to
+# the vectorized numpy path when it is not installed
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
 
+# matplotlib/seaborn/statsmodels are imported lazily (PEP 562) so scripts
+# that only need clean_vars or read_csv_robust don't pay their import tax
+_LAZY_IMPORTS = {'plt': 'matplotlib.pyplot', 'sns': 'seaborn', 'smf': 'statsmodels.formula.api'}
 
-random.seed(42)
-np.random.seed(42)
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Shared module-level generator; seeding no longer happens at import time so
+# importing helpers doesn't mutate the global random state of other modules
+RNG = np.random.default_rng(42)
 
 
 #####################################################################
 # DATA WRANGLING
 #####################################################################
 
+# Compiled once so clean_vars skips the re cache lookup on every call
+_CAMEL_RE = re.compile(r'([a-z0-9])([A-Z])')
+
+# How to case the cleaned string in clean_vars
+_CASE_FUNCS = {'title': str.title, 'lowercase': str.lower, 'uppercase': str.upper}
+
+
 def clean_vars(s, how='title'):
     """
     Simple function to clean titles for plots
@@ -33,41 +63,96 @@ def clean_vars(s, how='title'):
     Returns
     - cleaned string
     """
-    assert how in ['title', 'lowercase', 'uppercase'], "Bad option!! see docs"
-    s = re.sub('([a-z0-9])([A-Z])', r'\1 \2', s)
+    assert how in _CASE_FUNCS, "Bad option!! see docs"
+    # Fast path: plain names like 'price' have nothing to split, so skip the
+    # regex pass entirely (any() short-circuits on the first uppercase)
+    if '_' not in s and not any(c.isupper() for c in s[1:]):
+        return _CASE_FUNCS[how](s)
+    s = _CAMEL_RE.sub(r'\1 \2', s)
     s = s.replace('_', ' ')
-    if how == 'title':
-        return s.title()
-    elif how=='lower':
-        return s.lower()
-    elif how=='upper':
-        return s.upper()
+    return _CASE_FUNCS[how](s)
+
 
+@functools.lru_cache(maxsize=256)
+def _detect_encoding_cached(file_path, mtime, size, num_bytes):
+    """Detect encoding from the first num_bytes; mtime/size key the cache so edits invalidate."""
+    with open(file_path, 'rb') as file:
+        rawdata = file.read(num_bytes)
+        result = chardet.detect(rawdata)
+        return result['encoding']
 
-def read_csv_robust(file_path, sep=",", num_bytes=10000):
+
+def detect_encoding(file_path, num_bytes=10000):
+    """
+    Detect a file's encoding from a byte sample, with caching across calls.
+
+    Results are memoized on (path, mtime, size, num_bytes) so re-reading the
+    same file in a notebook session skips the detection step entirely.
+    """
+    return _detect_encoding_cached(
+        file_path, os.path.getmtime(file_path), os.path.getsize(file_path), num_bytes
+    )
+
+
+def _read_csv_attempt(buf, encoding, sep, dtype_backend=None):
+    """
+    Parse CSV bytes with pandas, preferring the multithreaded pyarrow engine.
+
+    Falls back to the default engine when pyarrow is not installed or rejects
+    the separator/options.
+    """
+    kwargs = {'encoding': encoding, 'on_bad_lines': 'skip', 'sep': sep}
+    if dtype_backend is not None:
+        kwargs['dtype_backend'] = dtype_backend
+    try:
+        return pd.read_csv(io.BytesIO(buf), engine='pyarrow', **kwargs)
+    except (ImportError, ValueError):
+        return pd.read_csv(io.BytesIO(buf), **kwargs)
+
+
+def read_csv_robust(file_path, sep=",", num_bytes=10000, dtype_backend=None, return_format='pandas'):
     """
     A function to robustly read in CSVs when they may contain different kinds of encoding errors
 
     Params:
         file_path (str): The file path
         sep (str): The string seperator
-        num_bytes(int, default=10000): Reads in this sample to get encoding 
+        num_bytes(int, default=10000): Reads in this sample to get encoding
+        dtype_backend (str, optional): Passed to pd.read_csv; set to 'pyarrow'
+            to keep columns Arrow-backed (lower memory on wide CSVs)
+        return_format (str, default='pandas'): 'arrow' routes UTF-8/ASCII files
+            through pyarrow's multithreaded SIMD parser and returns an
+            Arrow-backed df; falls back to the pandas path otherwise
 
     Returns
-        pandas df if success else None 
+        pandas df if success else None
     """
-    # Detect the file encoding
-    def detect_encoding(file_path, num_bytes):
-        with open(file_path, 'rb') as file:
-            rawdata = file.read(num_bytes)
-            result = chardet.detect(rawdata)
-            return result['encoding']
-
+    # Detect the file encoding (cached across calls on the same file)
     encoding_detected = detect_encoding(file_path, num_bytes)
 
+    # Read the bytes once so the fallback attempts reuse the same buffer
+    # instead of hitting the filesystem up to three times
+    with open(file_path, 'rb') as f:
+        buf = f.read()
+
+    # Arrow fast path: for UTF-8-family files, pyarrow's multithreaded parser
+    # beats pandas on wide/long CSVs and keeps the columnar layout
+    if return_format == 'arrow' and encoding_detected and \
+            encoding_detected.lower().replace('-', '').startswith(('utf', 'ascii')):
+        try:
+            import pyarrow.csv
+            table = pyarrow.csv.read_csv(
+                io.BytesIO(buf),
+                parse_options=pyarrow.csv.ParseOptions(delimiter=sep)
+            )
+            print(f"File read successfully with pyarrow (encoding: {encoding_detected})")
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        except Exception as e:
+            print(f"pyarrow fast path failed ({e}), falling back to pandas...")
+
     # Try reading the file with the detected encoding
     try:
-        df = pd.read_csv(file_path, encoding=encoding_detected, on_bad_lines='skip', sep=sep)
+        df = _read_csv_attempt(buf, encoding_detected, sep, dtype_backend)
         print(f"File read successfully with encoding: {encoding_detected}")
         return df
     except Exception as e:
@@ -76,7 +161,7 @@ def read_csv_robust(file_path, sep=",", num_bytes=10000):
         # Fallback to UTF-8
         try:
             print("Attempting to read with UTF-8...")
-            df = pd.read_csv(file_path, encoding='utf-8', on_bad_lines='skip', sep=sep)
+            df = _read_csv_attempt(buf, 'utf-8', sep, dtype_backend)
             print("File read successfully with UTF-8.")
             return df
         except Exception as e:
@@ -85,7 +170,7 @@ def read_csv_robust(file_path, sep=",", num_bytes=10000):
             # Second fallback to ISO-8859-1
             try:
                 print("Attempting to read with ISO-8859-1...")
-                df = pd.read_csv(file_path, encoding='ISO-8859-1', on_bad_lines='skip', sep=sep)
+                df = _read_csv_attempt(buf, 'ISO-8859-1', sep, dtype_backend)
                 print("File read successfully with ISO-8859-1.")
                 return df
             except Exception as e:
@@ -94,10 +179,38 @@ def read_csv_robust(file_path, sep=",", num_bytes=10000):
 
 
 
+def read_csvs_robust(paths, sep=",", num_bytes=10000, max_workers=None):
+    """
+    Read many CSVs with read_csv_robust in parallel threads.
+
+    pandas' parser and cchardet release the GIL for their native work, so
+    threads overlap disk waits with parse CPU when looping over many files.
+
+    Params:
+        paths (list of str): The file paths
+        sep (str): The string seperator
+        num_bytes (int, default=10000): Reads in this sample to get encoding
+        max_workers (int, optional): Thread count; defaults to
+            min(32, cpu_count + 4) like the stdlib
+
+    Returns
+        dict mapping each path to its pandas df
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {path: pool.submit(read_csv_robust, path, sep=sep, num_bytes=num_bytes)
+                   for path in paths}
+        return {path: future.result() for path, future in futures.items()}
+
+
 #####################################################################
-# LATEX 
+# LATEX
 #####################################################################
 
+# Characters stargazer2latex strips from rendered LaTeX
+_STAR_CLEAN = re.compile(r'_|T\.')
+
 def statsmodels2latex(model, beta_digits=2, se_digits=2, p_digits=3, ci_digits=2, print_sci_not=False):
     """
     This function summarizes the results from a fitted statistical model,
@@ -112,27 +225,37 @@ def statsmodels2latex(model, beta_digits=2, se_digits=2, p_digits=3, ci_digits=2
     - p_digits (default = 3): Number of decimal places for p-values.
     - ci_digits (default = 2): Number of decimal places for confidence intervals.
     - print_sci_not: Boolean to print very small p-values (p<0.001) in scientific notation or just write 'p<0.001'
-    
+
+    Returns:
+    - The full LaTeX block as a single string (one line per parameter). Also printed once.
     """
-    
+
     summary_strs = []
     # Check if the necessary methods are available in the model
     if not all(hasattr(model, attr) for attr in ['params', 'bse', 'pvalues', 'conf_int']):
         raise ValueError("Model does not have the required methods (params, bse, pvalues, conf_int).")
     
-    # Retrieve parameter estimates, standard errors, p-values, and confidence intervals
+    # Fetch every statistic once as a plain ndarray so the loop is positional
+    # indexing instead of label lookups (conf_int().loc was the worst offender)
     params = model.params
-    errors = model.bse
-    pvalues = model.pvalues
-    conf_int = model.conf_int()
-    
-    for param_name, beta in params.items():
+    names = list(params.index)
+    params_arr = params.to_numpy()
+    se_arr = model.bse.to_numpy()
+    p_arr = model.pvalues.to_numpy()
+    ci_arr = model.conf_int().to_numpy()
+
+    # Bake the digit counts into one template so each row is a single .format call
+    row_tmpl = (f"{{name}}: $\\beta = {{beta:.{beta_digits}f}}$, "
+                f"$SE = {{se:.{se_digits}f}}$, $p {{p}}$, "
+                f"$95\\% CI = [{{lo:.{ci_digits}f}}, {{hi:.{ci_digits}f}}]$")
+
+    for i, param_name in enumerate(names):
+        beta = params_arr[i]
+        se = se_arr[i]
+        p = p_arr[i]
+        ci_lower, ci_upper = ci_arr[i]
         # Escape LaTeX special characters in parameter names
         safe_param_name = param_name.replace('_', '\\_')
-        
-        se = errors[param_name]
-        p = pvalues[param_name]
-        ci_lower, ci_upper = conf_int.loc[param_name]
 
         if p < 0.001:
             if print_sci_not:
@@ -142,10 +265,14 @@ def statsmodels2latex(model, beta_digits=2, se_digits=2, p_digits=3, ci_digits=2
         else:
             p_formatted = f"= {p:.{p_digits}f}"
 
-        summary = (f"{safe_param_name}: $\\beta = {beta:.{beta_digits}f}$, "
-                   f"$SE = {se:.{se_digits}f}$, $p {p_formatted}$, "
-                   f"$95\\% CI = [{ci_lower:.{ci_digits}f}, {ci_upper:.{ci_digits}f}]$")
-        print(summary)
+        summary_strs.append(row_tmpl.format(
+            name=safe_param_name, beta=beta, se=se, p=p_formatted,
+            lo=ci_lower, hi=ci_upper
+        ))
+
+    latex_block = "\n".join(summary_strs)
+    print(latex_block)
+    return latex_block
 
 
 
@@ -187,8 +314,8 @@ def stargazer2latex(star, filename, add_ci=True, display_mod=False):
     
     # Stargazer adds "T." to factor variables which looks ugly so I remove these
     # Also, latex does not like underscores unless you're in math mode so remove too
-    latex_content = star.render_latex().replace("_", "")
-    latex_content = latex_content.replace("T.", "")
+    # (one compiled-regex pass instead of two full .replace scans)
+    latex_content = _STAR_CLEAN.sub('', star.render_latex())
     
     with open(filename, "w") as tex_file:
         tex_file.write(latex_content)
@@ -203,55 +330,81 @@ def stargazer2latex(star, filename, add_ci=True, display_mod=False):
 # PLOTTING
 #####################################################################
 
+# rcParams that make_aesthetic always sets; applied in one update() call so
+# matplotlib's per-key validator only runs over a single dict
+_RC_DEFAULTS = {
+    'axes.spines.right': False,
+    'axes.spines.top': False,
+    'axes.titlelocation': 'left',
+    'grid.alpha': 0.5,
+    'grid.linestyle': '--',
+    'axes.facecolor': 'white',
+    'legend.frameon': True,
+    'legend.framealpha': 0.8,
+    'legend.facecolor': 'white',
+    'savefig.bbox': 'tight',
+    'savefig.pad_inches': 0.1,
+    'figure.autolayout': True,
+}
+
+
+# Default hex palette for make_aesthetic
+_DEFAULT_PALETTE = (
+    "#89DAFF", # Pale azure
+    "#D41876", # Telemagenta
+    "#00A896", # Persian green,
+    "#826AED", # Medium slate blue
+    "#F7B2AD", # Melon
+    "#342E37", # Dark grayish-purple
+    "#7DCD85", # Emerald
+    "#E87461", # Medium-bright orange
+    "#E3B505", # Saffron
+    "#2C3531", # Dark charcoal gray with a green undertone
+    "#D4B2D8", # Pink lavender
+    "#7E6551", # Coyote
+    "#F45B69", # Vibrant pinkish-red
+    "#020887", # Phthalo Blue
+    "#F18805"  # Tangerine
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_palette(hex_tuple):
+    """Parse hex strings into a seaborn palette once per distinct color list"""
+    import seaborn as sns
+    return sns.color_palette(list(hex_tuple))
+
+
+@functools.lru_cache(maxsize=1)
+def _have_arial():
+    """Probe the font list once per process instead of try/except every call"""
+    try:
+        from matplotlib import font_manager
+        return any(f.name == 'Arial' for f in font_manager.fontManager.ttflist)
+    except Exception:
+        return False
+
+
 def make_aesthetic(hex_color_list=None, with_gridlines=False, bold_title=False, save_transparent=False, font_scale=2):
     """Make Seaborn look clean and add space between title and plot"""
-    
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     # Note: To make some parts of title bold and others not:
     # plt.title(r$'\bf{bolded title}$\nAnd a non-bold subtitle')
     
     sns.set(style='white', context='paper', font_scale=font_scale)
     if not hex_color_list:
-        hex_color_list = [
-        "#89DAFF", # Pale azure
-        "#D41876", # Telemagenta
-        "#00A896", # Persian green,
-        "#826AED", # Medium slate blue
-        "#F7B2AD", # Melon
-        "#342E37", # Dark grayish-purple
-        "#7DCD85", # Emerald
-        "#E87461", # Medium-bright orange
-        "#E3B505", # Saffron
-        "#2C3531", # Dark charcoal gray with a green undertone
-        "#D4B2D8", # Pink lavender
-        "#7E6551", # Coyote
-        "#F45B69", # Vibrant pinkish-red
-        "#020887", # Phthalo Blue
-        "#F18805"  # Tangerine
-        ]
-    sns.set_palette(sns.color_palette(hex_color_list))
-    try:
-        plt.rcParams['font.family'] = 'Arial'
-    except:
-        pass
-    plt.rcParams['axes.spines.right'] = False
-    plt.rcParams['axes.spines.top'] = False
-    plt.rcParams['axes.titlelocation'] = 'left'
-    if bold_title:
-        plt.rcParams['axes.titleweight'] = 'bold'
-    else:
-        plt.rcParams['axes.titleweight'] = 'regular'
-    plt.rcParams['axes.grid'] = with_gridlines
-    plt.rcParams['grid.alpha'] = 0.5
-    plt.rcParams['grid.linestyle'] = '--'
-    plt.rcParams['axes.facecolor'] = 'white'
-    plt.rcParams['legend.frameon'] = True
-    plt.rcParams['legend.framealpha'] = 0.8
-    plt.rcParams['legend.facecolor'] = 'white'
-    plt.rcParams['savefig.transparent'] = save_transparent
-    plt.rcParams['savefig.bbox'] = 'tight'
-    plt.rcParams['savefig.pad_inches'] = 0.1
-    plt.rcParams['figure.autolayout'] = True
-    plt.rcParams['axes.titlepad'] = 20*(font_scale/1)
+        hex_color_list = list(_DEFAULT_PALETTE)
+    sns.set_palette(_build_palette(tuple(hex_color_list)))
+    rc = dict(_RC_DEFAULTS)
+    if _have_arial():
+        rc['font.family'] = 'Arial'
+    rc['axes.titleweight'] = 'bold' if bold_title else 'regular'
+    rc['axes.grid'] = with_gridlines
+    rc['savefig.transparent'] = save_transparent
+    rc['axes.titlepad'] = 20*(font_scale/1)
+    plt.rcParams.update(rc)
     return hex_color_list
 
     
@@ -262,7 +415,60 @@ def make_aesthetic(hex_color_list=None, with_gridlines=False, bold_title=False,
 #####################################################################
 
 
-def pretty_print_desc_stats(data, n_bootstrap=10000, ci=False, ci_level=0.95, n_digits=2, seed=42):
+if _HAS_NUMBA:
+    @njit(fastmath=True, cache=True)
+    def _mean_sd_jit(data):
+        """One-pass mean and sample sd via Welford's algorithm."""
+        n = data.size
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n):
+            delta = data[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (data[i] - mean)
+        return mean, np.sqrt(m2 / (n - 1))
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _boot_means_jit(data, n_bootstrap, seed):
+        """Bootstrap resample means without materializing index matrices."""
+        np.random.seed(seed)
+        n = data.size
+        out = np.empty(n_bootstrap)
+        for b in prange(n_bootstrap):
+            s = 0.0
+            for _ in range(n):
+                s += data[np.random.randint(0, n)]
+            out[b] = s / n
+        return out
+
+
+def _bootstrap_means(data, n_bootstrap, seed, chunk_size=1024, rng=None):
+    """
+    Compute bootstrap resample means with vectorized numpy sampling.
+
+    Draws index matrices in chunks of `chunk_size` resamples (so peak memory
+    stays bounded for large data) and reduces each chunk with one mean call,
+    instead of looping over resamples in Python like scipy.stats.bootstrap.
+    For big jobs (data.size * n_bootstrap > 1e6) a numba kernel computes each
+    resample mean in registers instead, skipping the index matrices entirely.
+    Pass an explicit `rng` (np.random.Generator) to draw from shared state
+    rather than reseeding from `seed`.
+    """
+    n = data.size
+    if rng is None and _HAS_NUMBA and n * n_bootstrap > 1e6:
+        return _boot_means_jit(np.asarray(data, dtype=np.float64), n_bootstrap, seed)
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    means = np.empty(n_bootstrap)
+    for start in range(0, n_bootstrap, chunk_size):
+        stop = min(start + chunk_size, n_bootstrap)
+        idx = rng.integers(0, n, size=(stop - start, n))
+        means[start:stop] = data[idx].mean(axis=1)
+    return means
+
+
+def pretty_print_desc_stats(data, n_bootstrap=10000, ci=False, ci_level=0.95, n_digits=2, seed=42, rng=None,
+                            method='bootstrap'):
     """
     Calculate descriptive statistics and print a LaTeX string in APA format.
 
@@ -273,26 +479,38 @@ def pretty_print_desc_stats(data, n_bootstrap=10000, ci=False, ci_level=0.95, n_
         ci_level (float, optional): Confidence interval level if ci is True. Default is 0.95.
         n_digits (int, optional): Number of digits to round the values to. Default is 2.
         seed (int, optional): Random seed for reproducibility. Default is 42.
+        rng (np.random.Generator, optional): Generator to draw from instead of
+            reseeding (e.g., the module-level RNG). Overrides seed.
+        method (str, optional): 'bootstrap' (default) for percentile
+            resampling, or 'analytic' for the CLT interval, which skips
+            resampling entirely.
 
     Returns:
         str: A formatted LaTeX string with the mean, median, and standard deviation,
              and optionally the confidence interval.
     """
     data = np.array(data)
-    
-    mean = np.mean(data)
+
+    # For big arrays, fuse mean and sd into one pass (half the memory traffic);
+    # median stays np.median, which is already O(n) via introselect
+    if _HAS_NUMBA and data.size >= 1000:
+        mean, sd = _mean_sd_jit(np.asarray(data, dtype=np.float64))
+    else:
+        mean = np.mean(data)
+        sd = np.std(data, ddof=1)
     median = np.median(data)
-    sd = np.std(data, ddof=1)
-    
+
+
     if ci:
-        bootstrap_results = bootstrap(
-            (data,),
-            np.mean,
-            n_resamples=n_bootstrap,
-            random_state=seed,
-            confidence_level=ci_level
-        )
-        ci_lower, ci_upper = bootstrap_results.confidence_interval
+        if method == 'analytic':
+            from scipy.stats import norm
+            se = sd / np.sqrt(data.size)
+            z = norm.ppf(0.5 + ci_level / 2)
+            ci_lower, ci_upper = mean - z * se, mean + z * se
+        else:
+            boot_means = _bootstrap_means(data, n_bootstrap, seed, rng=rng)
+            alpha = (1 - ci_level) / 2
+            ci_lower, ci_upper = np.quantile(boot_means, [alpha, 1 - alpha])
         ci_str = f", {int(ci_level*100)}\\% \\text{{CI}} = [{ci_lower:.{n_digits}f}, {ci_upper:.{n_digits}f}]"
     else:
         ci_str = ""
@@ -306,49 +524,54 @@ def pretty_print_desc_stats(data, n_bootstrap=10000, ci=False, ci_level=0.95, n_
     return latex_string
 
 
-def bootstrap_mean(data, n_bootstrap=10000, ci=95, seed=42):
+def bootstrap_mean(data, n_bootstrap=10000, ci=95, seed=42, rng=None, method='bootstrap'):
     """
-    Generate bootstrap confidence interval for the mean of the input data using scipy.stats.bootstrap.
+    Generate bootstrap confidence interval for the mean of the input data using vectorized numpy resampling.
     
     Args:
         data: The input data. Can be a Pandas Series, list, or numpy array.
         n_bootstrap: The number of bootstrap samples to generate. Default is 10000.
         ci: The confidence interval percentage. Default is 95%.
         seed: The random seed for reproducibility. Default is 42.
-    
+        rng: Optional np.random.Generator to draw from instead of reseeding
+            (e.g., the module-level RNG). Overrides seed.
+        method: 'bootstrap' (default) for percentile resampling, or 'analytic'
+            for the CLT interval mean +/- z * sd/sqrt(n), which skips
+            resampling entirely (O(n) instead of O(n_bootstrap * n)).
+
     Returns:
         A dict with keys 'mean', 'lower', and 'upper'
     
     Raises:
-        ValueError: If the input data is not a recognized type or is empty.
+        ValueError: If the input data is empty.
     """
-    if isinstance(data, pd.Series):
-        data = data.to_numpy()
-    elif isinstance(data, list):
-        data = np.array(data)
-    elif isinstance(data, np.ndarray):
-        pass  # Already a numpy array
-    else:
-        raise ValueError("Input data must be a Pandas Series, list, or numpy array")
+    # asarray handles Series/list/ndarray uniformly in one C call
+    data = np.ascontiguousarray(np.asarray(data).ravel())
 
     if data.size == 0:
         raise ValueError("Input data is empty")
 
-    data = data.ravel()
+    if method not in ('bootstrap', 'analytic'):
+        raise ValueError("method must be 'bootstrap' or 'analytic'")
 
     data_mean = np.mean(data)
 
-    result = bootstrap(
-        (data,),
-        np.mean,
-        n_resamples=n_bootstrap,
-        random_state=seed,
-        confidence_level=ci/100,
-        method='percentile'
-    )
+    if method == 'analytic':
+        from scipy.stats import norm
+        se = data.std(ddof=1) / np.sqrt(data.size)
+        z = norm.ppf(0.5 + ci / 200)
+        return {
+            'mean': data_mean,
+            'lower': data_mean - z * se,
+            'upper': data_mean + z * se
+        }
+
+    boot_means = _bootstrap_means(data, n_bootstrap, seed, rng=rng)
+    alpha = (1 - ci / 100) / 2
+    lower, upper = np.quantile(boot_means, [alpha, 1 - alpha])
 
     return {
         'mean': data_mean,
-        'lower': result.confidence_interval.low,
-        'upper': result.confidence_interval.high
+        'lower': lower,
+        'upper': upper
     }